@@ -1,4 +1,5 @@
 import aiohttp
+import asyncio
 import os
 import re
 from pyrogram import Client, filters
@@ -8,6 +9,8 @@ from utils.misc import modules_help, prefix
 SEARCH_API = "https://api.nekorinn.my.id/search/youtube?q={}"
 DL_API = "https://api.nekorinn.my.id/downloader/savetube?url={}&format={}"
 YOUTUBE_LINK_REGEX = re.compile(r'(https?://)?(www\.)?(youtube\.com/(watch\?v=|shorts/)|youtu\.be/)[\w\-]{11,}')
+DOWNLOAD_CHUNK = 256 * 1024
+UNSAFE_NAME_REGEX = re.compile(r"[^\w.\- ]")  # same set as str.isalnum() plus "._- "
 
 async def fetch_json(url):
     async with aiohttp.ClientSession() as session:
@@ -18,7 +21,7 @@ async def download_file(url, path):
     async with aiohttp.ClientSession() as session:
         async with session.get(url) as resp:
             with open(path, "wb") as f:
-                while chunk := await resp.content.read(1024):
+                async for chunk in resp.content.iter_chunked(DOWNLOAD_CHUNK):
                     f.write(chunk)
 
 def extract_youtube_link(text):
@@ -29,7 +32,7 @@ def extract_youtube_link(text):
     return None
 
 def safe_filename(title, ext):
-    name = "".join(x for x in title if x.isalnum() or x in "._- ").strip() or "youtube_file"
+    name = UNSAFE_NAME_REGEX.sub("", title).strip() or "youtube_file"
     return f"{name}.{ext}"
 
 async def resolve_input(message, cmd):
@@ -65,13 +68,20 @@ async def process_download(client, message, status, video, fmt, send_type):
     ext = "mp3" if fmt == "mp3" else "mp4"
     fname = safe_filename(title, ext)
     thumb = result.get("cover")
-    thumb_path = None
-    if thumb:
-        thumb_path = safe_filename(title, "jpg")
-        await download_file(thumb, thumb_path)
+    thumb_path = safe_filename(title, "jpg") if thumb else None
     try:
         await status.edit_text(f"<code>Downloading {'audio' if fmt == 'mp3' else 'video'}: {title} ({fmt})...</code>")
-        await download_file(durl, fname)
+        # Fetch the thumbnail alongside the media instead of before it
+        downloads = [download_file(durl, fname)]
+        if thumb_path:
+            downloads.append(download_file(thumb, thumb_path))
+        # Let both finish before raising so cleanup never races a running write
+        media_error, *thumb_error = await asyncio.gather(*downloads, return_exceptions=True)
+        if thumb_error and isinstance(thumb_error[0], Exception):
+            # The thumbnail is optional; send without it rather than a partial file
+            if os.path.exists(thumb_path): os.remove(thumb_path)
+        if isinstance(media_error, Exception):
+            raise media_error
         caption = f"<b>Title:</b> {result.get('title', title)}\n<b>Format:</b> {result.get('format', fmt)}"
         send = client.send_audio if send_type == "audio" else client.send_video
         await send(